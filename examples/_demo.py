@@ -0,0 +1,51 @@
+"""Operation pacing helpers shared by main.py and examples/plugin.py."""
+
+import time
+
+# Counters are flushed every FLUSH_OPS operations or FLUSH_INTERVAL seconds,
+# whichever comes first
+FLUSH_OPS = 10
+FLUSH_INTERVAL = 0.1
+
+# Target time per simulated operation, in seconds
+OP_INTERVAL = 0.01
+
+# Pre-encoded ASCII of small integers, so a user-field flush only joins bytes
+_INT_BYTES = [str(i).encode() for i in range(2000)]
+
+
+def int_to_ascii(n):
+    """Return n as ASCII bytes, using the cache for common values."""
+    return _INT_BYTES[n] if 0 <= n < len(_INT_BYTES) else str(n).encode()
+
+
+def run_paced_operations(count, flush, total=0, interval=OP_INTERVAL,
+                         flush_ops=FLUSH_OPS, flush_interval=FLUSH_INTERVAL):
+    """Simulate count operations paced interval seconds apart.
+
+    Completed operations are reported in batches via flush(batch, total),
+    where total is the running count tracked locally from the starting
+    total, so callers need not read it back from shared memory. Any
+    remaining operations are flushed once the loop ends.
+
+    Returns:
+        int: The final running total.
+    """
+    monotonic = time.monotonic
+    sleep = time.sleep
+    pending = 0
+    deadline = last_flush = monotonic()
+    for _ in range(count):
+        deadline += interval
+        remaining = deadline - monotonic()
+        if remaining > 0.001:
+            sleep(remaining)
+        pending += 1
+        total += 1
+        if pending >= flush_ops or monotonic() - last_flush > flush_interval:
+            flush(pending, total)
+            pending = 0
+            last_flush = monotonic()
+    if pending:
+        flush(pending, total)
+    return total
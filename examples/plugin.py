@@ -1,11 +1,37 @@
+import ctypes
 import logging
 import sys
-import time
 
 from py_burnin_plugin import BurnInPlugin, ErrorSeverity, StatusCode
+from py_burnin_plugin.core.common import PLUGIN_MAXDISPLAYTEXT, PLUGIN_MAXERRORTEXT
+from py_burnin_plugin.utils import clean_and_pad
+from _demo import int_to_ascii, run_paced_operations
+
+WRITES_SUFFIX = b" writes step 1"
+READS_SUFFIX = b" reads step 1"
+
+
+def set_timer_resolution(enabled):
+    """Request a 1 ms system timer on Windows so short sleeps are accurate."""
+    if sys.platform != "win32":
+        return
+    winmm = ctypes.WinDLL("winmm")
+    if enabled:
+        winmm.timeBeginPeriod(1)
+    else:
+        winmm.timeEndPeriod(1)
 
 
 class TestPlugin(BurnInPlugin):
+    _STATUS_BLOBS = {
+        "write": clean_and_pad("Plug-in write", PLUGIN_MAXDISPLAYTEXT),
+        "read": clean_and_pad("Plug-in read", PLUGIN_MAXDISPLAYTEXT),
+        "verify": clean_and_pad("Plug-in verify", PLUGIN_MAXDISPLAYTEXT),
+    }
+    _PHASE2_TITLE = clean_and_pad("Test plugin2", PLUGIN_MAXDISPLAYTEXT)
+    _PHASE2_STATUS = clean_and_pad("Testing XYZ", PLUGIN_MAXDISPLAYTEXT)
+    _ERR_BLOB = clean_and_pad("Plugin error: ABCDEFGHIJKLMNOPQRSTUVWXYZ", PLUGIN_MAXERRORTEXT)
+
     def __init__(self, shm_name, logger):
         super().__init__(shm_name, logger)
         self.test_phase = 1
@@ -21,48 +47,59 @@ class TestPlugin(BurnInPlugin):
         self._interface.set_user_field(1, "Message 1", "0 writes")
         self._interface.set_user_field(2, "Message 2", "0 reads")
 
+        set_timer_resolution(True)
         return super().on_start()
 
+    def on_stop(self):
+        set_timer_resolution(False)
+        return super().on_stop()
+
     def execute_write_phase(self):
         # Write phase
-        self._interface.status_code = StatusCode.PLUGIN_WRITING
-        self._interface.status = "Plug-in write"
-
-        for i in range(self.num_writes):
-            time.sleep(0.01)
-            self._interface.increment_metrics(write_ops=1)
-            # Update user-defined values
-            if self.test_phase == 1:
-                val = f"{self._interface.write_operations} writes step 1"
-                self._interface.set_user_field(1, "Message 1", val)
+        iface = self._interface
+        iface.set_status(StatusCode.PLUGIN_WRITING, self._STATUS_BLOBS["write"])
+
+        # test_phase only changes between cycles, so pick the flush once
+        flush = self._flush_writes_step1 if self.test_phase == 1 else self._flush_writes
+        run_paced_operations(self.num_writes, flush, iface.write_operations)
         return True
 
     def execute_read_phase(self):
-        self._interface.status_code = StatusCode.PLUGIN_READING
-        self._interface.status = "Plug-in read"
-
-        for i in range(self.num_writes):
-            time.sleep(0.01)
-            self._interface.increment_metrics(read_ops=1)
-            if self.test_phase == 1:
-                val = f"{self._interface.read_operations} reads step 1"
-                self._interface.set_user_field(2, "Message 2", val)
+        iface = self._interface
+        iface.set_status(StatusCode.PLUGIN_READING, self._STATUS_BLOBS["read"])
+
+        flush = self._flush_reads_step1 if self.test_phase == 1 else self._flush_reads
+        run_paced_operations(self.num_writes, flush, iface.read_operations)
         return True
 
+    def _flush_writes(self, count, total):
+        self._interface.increment_metrics(write_ops=count)
+
+    def _flush_writes_step1(self, count, total):
+        iface = self._interface
+        iface.increment_metrics(write_ops=count)
+        # Update user-defined values
+        iface.set_user_field(1, "Message 1", int_to_ascii(total) + WRITES_SUFFIX)
+
+    def _flush_reads(self, count, total):
+        self._interface.increment_metrics(read_ops=count)
+
+    def _flush_reads_step1(self, count, total):
+        iface = self._interface
+        iface.increment_metrics(read_ops=count)
+        iface.set_user_field(2, "Message 2", int_to_ascii(total) + READS_SUFFIX)
+
     def execute_verify_phase(self):
-        self._interface.status_code = StatusCode.PLUGIN_VERIFYING
-        self._interface.status = "Plug-in verify"
+        self._interface.set_status(StatusCode.PLUGIN_VERIFYING, self._STATUS_BLOBS["verify"])
 
-        self._interface.increment_metrics(verify_ops=1)
         # Simulate error for demo
-        self._interface.increment_metrics(error_count=1)
-        self._interface.error_message = "Plugin error: ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-        self._interface.error_severity = ErrorSeverity.INFORMATION
+        self._interface.increment_metrics(verify_ops=1, error_count=1)
+        self._interface.set_error_blob(self._ERR_BLOB, ErrorSeverity.INFORMATION)
         return True
 
     def on_cycle_start(self, cycle):
-        logging.debug("Running")
-        logging.info(f"Duty cycle: {self._interface.duty_cycle}")
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info("Running cycle %d, duty cycle: %d", cycle, self._interface.duty_cycle)
         return super().on_cycle_start(cycle)
 
     def on_cycle_end(self, cycle):
@@ -70,12 +107,9 @@ class TestPlugin(BurnInPlugin):
 
         # Phase change after 10 cycles
         if self._interface.cycle >= 10 and self.test_phase == 1:
-            while self._interface.display_text_set:
-                time.sleep(0.1)
+            self._interface.wait_display_text_cleared()
             # Update labels for phase 2
-            self._interface.window_title = "Test plugin2"
-            self._interface.status = "Testing XYZ"
-            self._interface.display_text_set = True
+            self._interface.set_display_text(self._PHASE2_TITLE, self._PHASE2_STATUS)
             self.test_phase = 2
 
 
@@ -1,3 +1,4 @@
+import os
 import sys
 import time
 import ctypes
@@ -15,6 +16,24 @@ from py_burnin_plugin import (
     PluginInterface,
     PluginInterfaceStructure,
 )
+from py_burnin_plugin.core.common import PLUGIN_MAXDISPLAYTEXT, PLUGIN_MAXERRORTEXT
+from py_burnin_plugin.utils import clean_and_pad
+from examples._demo import int_to_ascii, run_paced_operations
+
+# Status texts are fixed, so they are prepared before the test loop
+WRITE_STATUS = clean_and_pad("Plug-in write", PLUGIN_MAXDISPLAYTEXT)
+READ_STATUS = clean_and_pad("Plug-in read", PLUGIN_MAXDISPLAYTEXT)
+VERIFY_STATUS = clean_and_pad("Plug-in verify", PLUGIN_MAXDISPLAYTEXT)
+PHASE2_TITLE = clean_and_pad("Test plugin2", PLUGIN_MAXDISPLAYTEXT)
+PHASE2_STATUS = clean_and_pad("Testing XYZ", PLUGIN_MAXDISPLAYTEXT)
+DEMO_ERROR = clean_and_pad("Plugin error: ABCDEFGHIJKLMNOPQRSTUVWXYZ", PLUGIN_MAXERRORTEXT)
+
+WRITES_SUFFIX = b" writes step 1"
+READS_SUFFIX = b" reads step 1"
+
+# Set by standalone_test.py to the name of an event to signal after each cycle
+CYCLE_EVENT_ENV = "BURNIN_CYCLE_EVENT"
+EVENT_MODIFY_STATE = 0x0002
 
 
 def main():
@@ -45,45 +64,59 @@ def main():
     i_test_phase = 1
     i_num_writes = 100  # Demo value    
 
+    winmm = ctypes.WinDLL("winmm")
+    kernel32 = ctypes.WinDLL("kernel32")
+    kernel32.OpenEventW.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.LPCWSTR]
+    kernel32.OpenEventW.restype = wintypes.HANDLE
+    kernel32.SetEvent.argtypes = [wintypes.HANDLE]
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    cycle_event = None
+
+    def flush_writes(count, total):
+        interface.increment_metrics(write_ops=count)
+        # Update user-defined values
+        if i_test_phase == 1:
+            interface.set_user_field(1, "OUT_szUserDefVal1", int_to_ascii(total) + WRITES_SUFFIX)
+
+    def flush_reads(count, total):
+        interface.increment_metrics(read_ops=count)
+        if i_test_phase == 1:
+            interface.set_user_field(1, "OUT_szUserDefVal2", int_to_ascii(total) + READS_SUFFIX)
+
     try:
+        # 1 ms timer resolution so the 10 ms operation pacing is accurate;
+        # undone in the finally block below
+        winmm.timeBeginPeriod(1)
+
+        # Event the standalone test harness blocks on, if it provided one
+        event_name = os.environ.get(CYCLE_EVENT_ENV)
+        if event_name:
+            cycle_event = kernel32.OpenEventW(EVENT_MODIFY_STATE, False, event_name)
+
         while interface.test_running:
-            logging.debug("Running")
-            logging.info(f"Duty cycle: {interface.duty_cycle}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Running cycle %d, duty cycle: %d", interface.cycle, interface.duty_cycle)
             # Write phase
-            interface.status_code = StatusCode.PLUGIN_WRITING
-            interface.status = "Plug-in write"
+            interface.set_status(StatusCode.PLUGIN_WRITING, WRITE_STATUS)
 
-            for i in range(i_num_writes):
-                time.sleep(0.01)
-                interface.increment_metrics(write_ops=1)
-                # Update user-defined values
-                if i_test_phase == 1:
-                    val = f"{interface.write_operations} writes step 1".encode()
-                    interface.set_user_field(1, "OUT_szUserDefVal1", val)
+            run_paced_operations(i_num_writes, flush_writes, interface.write_operations)
 
             # Read phase
-            interface.status_code = StatusCode.PLUGIN_READING
-            interface.status = "Plug-in read"
+            interface.set_status(StatusCode.PLUGIN_READING, READ_STATUS)
 
-            for i in range(i_num_writes):
-                time.sleep(0.01)
-                interface.increment_metrics(read_ops=1)
-                if i_test_phase == 1:
-                    val = f"{interface.read_operations} reads step 1".encode()
-                    interface.set_user_field(1, "OUT_szUserDefVal2", val)
+            run_paced_operations(i_num_writes, flush_reads, interface.read_operations)
 
             # Verify phase
-            interface.status_code = StatusCode.PLUGIN_VERIFYING
-            interface.status = "Plug-in verify"
+            interface.set_status(StatusCode.PLUGIN_VERIFYING, VERIFY_STATUS)
 
-            interface.increment_metrics(verify_ops=1)
             # Simulate error for demo
-            interface.increment_metrics(error_count=1)
-            interface.error_message = "Plugin error: ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-            interface.error_severity = ErrorSeverity.INFORMATION
+            interface.increment_metrics(verify_ops=1, error_count=1)
+            interface.set_error_blob(DEMO_ERROR, ErrorSeverity.INFORMATION)
 
             # Update cycle counter
             interface.increment_cycle()
+            if cycle_event:
+                kernel32.SetEvent(cycle_event)
 
             # Duty cycle delay
             sleep_time = (100 - interface.duty_cycle) * 0.02
@@ -92,19 +125,18 @@ def main():
 
             # Phase change after 10 cycles
             if interface.cycle >= 10 and i_test_phase == 1:
-                while interface.display_text_set:
-                    time.sleep(0.1)
+                interface.wait_display_text_cleared()
                 # Update labels for phase 2
-                interface.window_title = "Test plugin2"
-                interface.status = "Testing XYZ"
-                # ... update other labels
-                interface.display_text_set = True
+                interface.set_display_text(PHASE2_TITLE, PHASE2_STATUS)
                 i_test_phase = 2
 
-        logging.debug("Stopped")
+        logger.debug("Stopped")
     finally:
         # Cleanup
         interface.status_code = StatusCode.PLUGIN_CLEANUP
+        winmm.timeEndPeriod(1)
+        if cycle_event:
+            kernel32.CloseHandle(cycle_event)
 
         connection.disconnect()
 
@@ -87,25 +87,26 @@ class PLUGININTERFACE(LittleEndianStructure):
         ("OUT_szErrorLong", c_char * PLUGIN_MAXERRORTEXTLONG),
     ]
 
+# Packed size of the V4 interface: the sum of all field sizes
+EXPECTED_V4_SIZE = sum(ctypes.sizeof(t) for _, t in PLUGININTERFACE._fields_)
+assert ctypes.sizeof(PLUGININTERFACE) == EXPECTED_V4_SIZE, \
+    f"PLUGININTERFACE layout mismatch {ctypes.sizeof(PLUGININTERFACE)} != {EXPECTED_V4_SIZE}"
+
+# Translation table for strn_clean_cpy: control characters, '%' and '\\'
+# become spaces, everything else is passed through unchanged
+_CLEAN_TBL = bytes(
+    ord(' ') if (b < 0x20 or b in (0x25, 0x5C)) else b for b in range(256)
+)
+
 def strn_clean_cpy(text_out, text_in, max_len):
     """Replicate the C++ strn_clean_cpy function"""
     # Convert input to bytes if it's a string
     if isinstance(text_in, str):
         text_in = text_in.encode('ascii', 'ignore')
-    
-    # Ensure we don't exceed max length
-    text_in = text_in[:max_len-1]
-    
-    # Clean the string (remove funny characters, '%' and '\')
-    cleaned = bytearray()
-    for b in text_in:
-        if b < 0x20 or b == ord('%') or b == ord('\\'):
-            cleaned.append(ord(' '))
-        else:
-            cleaned.append(b)
-    
-    # Ensure null termination
-    cleaned = cleaned.ljust(max_len, b'\0')
-    
+
+    # Clean the string (remove funny characters, '%' and '\\') and ensure
+    # null termination
+    cleaned = text_in[:max_len-1].translate(_CLEAN_TBL).ljust(max_len, b'\0')
+
     # Copy to output
-    ctypes.memmove(text_out, cleaned, max_len) 
\ No newline at end of file
+    ctypes.memmove(text_out, cleaned, max_len) 
@@ -7,6 +7,7 @@ from .core import (
     PluginError,
     PluginInterface,
     PluginInterfaceStructure,
+    PluginSnapshot,
     StatusCode,
     ValidationError,
 )
@@ -20,6 +21,7 @@ __all__ = [
     "PluginError",
     "PluginInterface",
     "PluginInterfaceStructure",
+    "PluginSnapshot",
     "StatusCode",
     "ValidationError",
 ]
@@ -1,6 +1,6 @@
 from .common import ConnectionError, ErrorSeverity, InterfaceError, PluginError, StatusCode, ValidationError
 from .connection import PluginConnection
-from .interface import PluginInterface, PluginInterfaceStructure
+from .interface import PluginInterface, PluginInterfaceStructure, PluginSnapshot
 from .plugin import BurnInPlugin
 
 __all__ = [
@@ -12,6 +12,7 @@ __all__ = [
     "PluginError",
     "PluginInterface",
     "PluginInterfaceStructure",
+    "PluginSnapshot",
     "StatusCode",
     "ValidationError",
 ]
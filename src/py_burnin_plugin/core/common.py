@@ -1,5 +1,6 @@
+import time
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum
 
 # Plugin Interface Constants
 PLUGIN_INTERFACE_VERSION = 4
@@ -7,7 +8,7 @@ PLUGIN_MAXDISPLAYTEXT = 20
 PLUGIN_MAXERRORTEXT = 100
 PLUGIN_MAXERRORTEXTLONG = 201
 
-class ErrorSeverity(Enum):
+class ErrorSeverity(IntEnum):
     """Error severity levels for BurnInTest error reporting."""
     NONE = 0
     INFORMATION = 1
@@ -16,7 +17,7 @@ class ErrorSeverity(Enum):
     CRITICAL = 4
     TERMINAL = 5
 
-class StatusCode(Enum):
+class StatusCode(IntEnum):
     """Status codes for BurnInTest plugin states."""
     PLUGIN_NOSTATUS = 0
     PLUGIN_STARTUP = 1
@@ -33,6 +34,8 @@ class StatusCode(Enum):
 class PluginError(Exception):
     """Base exception for BurnInTest plugin errors."""
 
+    __slots__ = ("message", "severity", "original_error", "timestamp_ns")
+
     def __init__(
         self,
         message: str,
@@ -43,7 +46,12 @@ class PluginError(Exception):
         self.message = message
         self.severity = severity
         self.original_error = original_error
-        self.timestamp = datetime.now()
+        self.timestamp_ns = time.time_ns()
+
+    @property
+    def timestamp(self) -> datetime:
+        """Local time at which the error was created."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
 
     def __str__(self) -> str:
         return f"[{self.severity.name}] {self.message}"
@@ -51,6 +59,8 @@ class PluginError(Exception):
 class ConnectionError(PluginError):
     """Exception raised when plugin connection fails."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, original_error: Exception | None = None) -> None:
         super().__init__(message, ErrorSeverity.CRITICAL, original_error)
 
@@ -58,6 +68,8 @@ class ConnectionError(PluginError):
 class InterfaceError(PluginError):
     """Exception raised when interface operations fail."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, original_error: Exception | None = None) -> None:
         super().__init__(message, ErrorSeverity.SERIOUS, original_error)
 
@@ -65,6 +77,8 @@ class InterfaceError(PluginError):
 class ValidationError(PluginError):
     """Exception raised when data validation fails."""
 
+    __slots__ = ("field",)
+
     def __init__(self, message: str, field: str | None = None) -> None:
         super().__init__(message, ErrorSeverity.WARNING)
         self.field = field
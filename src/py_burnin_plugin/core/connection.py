@@ -1,7 +1,7 @@
 import logging
 import time
-from ctypes import GetLastError, WinDLL, c_size_t, c_void_p, create_unicode_buffer
-from ctypes.wintypes import BOOL, DWORD, HANDLE, LPCWSTR
+from ctypes import WinDLL, c_size_t, c_ubyte, c_void_p, create_unicode_buffer, get_last_error, sizeof
+from ctypes.wintypes import BOOL, DWORD, HANDLE, LPCWSTR, LPVOID
 
 from .common import (
     ConnectionError,
@@ -16,66 +16,150 @@ DEFAULT_BUFFER_SIZE = 4096
 CONNECTION_TIMEOUT = 5000  # milliseconds
 FILE_MAP_ALL_ACCESS = 0xF001F
 
+# Default operation labels written on connect
+_WRITE_LABEL = b"Write:"
+_READ_LABEL = b"Read:"
+_VERIFY_LABEL = b"Verify:"
+
+# Bytes mapped from the shared memory object
+_INTERFACE_SIZE = sizeof(PluginInterfaceStructure)
+
+def split_dword(value: int) -> tuple[int, int]:
+    """Split a 64-bit value into (high, low) DWORDs for Windows API calls.
+
+    Args:
+        value (int): Value in the range 0 to 2**64 - 1.
+
+    Returns:
+        tuple[int, int]: High and low 32-bit halves.
+    """
+    return (value >> 32) & 0xFFFFFFFF, value & 0xFFFFFFFF
+
+
+# kernel32 functions, loaded and typed once per process. ctypes saves the
+# thread's last-error value after each call made through this library.
+_KERNEL32 = WinDLL('kernel32', use_last_error=True)
+
+_OPEN_FILE_MAPPING = _KERNEL32.OpenFileMappingW
+_OPEN_FILE_MAPPING.argtypes = [DWORD, BOOL, LPCWSTR]
+_OPEN_FILE_MAPPING.restype = HANDLE
+
+_MAP_VIEW_OF_FILE = _KERNEL32.MapViewOfFile
+_MAP_VIEW_OF_FILE.argtypes = [HANDLE, DWORD, DWORD, DWORD, c_size_t]
+_MAP_VIEW_OF_FILE.restype = c_void_p
+
+_MAP_VIEW_OF_FILE_EX = _KERNEL32.MapViewOfFileEx
+_MAP_VIEW_OF_FILE_EX.argtypes = [HANDLE, DWORD, DWORD, DWORD, c_size_t, LPVOID]
+_MAP_VIEW_OF_FILE_EX.restype = c_void_p
+
+_UNMAP_VIEW_OF_FILE = _KERNEL32.UnmapViewOfFile
+_UNMAP_VIEW_OF_FILE.argtypes = [c_void_p]
+_UNMAP_VIEW_OF_FILE.restype = BOOL
+
+_CLOSE_HANDLE = _KERNEL32.CloseHandle
+_CLOSE_HANDLE.argtypes = [HANDLE]
+_CLOSE_HANDLE.restype = BOOL
+
+_FORMAT_MESSAGE = _KERNEL32.FormatMessageW
+
+
+def _format_error(error_code: int) -> str:
+    """Format a Windows error code as a message.
+
+    Args:
+        error_code (int): Windows error code.
+
+    Returns:
+        str: Formatted error message.
+    """
+    if error_code == 0:
+        return "No error"
+
+    buffer = create_unicode_buffer(256)
+    _FORMAT_MESSAGE(
+        0x00001000,  # FORMAT_MESSAGE_FROM_SYSTEM
+        None,
+        error_code,
+        0,
+        buffer,
+        len(buffer),
+        None
+    )
+
+    return f"Error {error_code}: {buffer.value.strip()}"
+
+
+def _map_view(
+    handle: int, access: int, size: int, offset: int = 0, base_address: int | None = None
+) -> int | None:
+    """Map a view of a file mapping with MapViewOfFileEx.
+
+    Args:
+        handle (int): File mapping handle.
+        access (int): Desired access (FILE_MAP_* flags).
+        size (int): Number of bytes to map.
+        offset (int): 64-bit file offset, split into high/low DWORDs.
+        base_address (int | None): Requested base address, None lets the
+            system choose.
+
+    Returns:
+        int | None: Address of the mapped view, None on failure.
+    """
+    offset_high, offset_low = split_dword(offset)
+    return _MAP_VIEW_OF_FILE_EX(handle, access, offset_high, offset_low, size, base_address)
+
+
+class LastError:
+    """Windows error code whose message is formatted only when needed.
+
+    Captures the last-error value immediately; FormatMessageW is called
+    the first time the error is converted to a string.
+    """
+
+    __slots__ = ("code", "_message")
+
+    def __init__(self, code: int) -> None:
+        self.code = code
+        self._message: str | None = None
+
+    def __bool__(self) -> bool:
+        return self.code != 0
+
+    def __str__(self) -> str:
+        if self._message is None:
+            self._message = _format_error(self.code)
+        return self._message
+
+    def __repr__(self) -> str:
+        return f"LastError(code={self.code})"
+
+
+def _last_error() -> LastError:
+    """Get the last Windows error, with its message formatted lazily."""
+    return LastError(get_last_error())
+
+
 class WindowsAPI:
-    """Windows API wrapper for shared memory operations."""
-
-    def __init__(self) -> None:
-        """Initialize Windows API handles."""
-        self.kernel32 = WinDLL('kernel32', use_last_error=True)
-
-        # Setup function signatures
-        self.OpenFileMapping = self.kernel32.OpenFileMappingW
-        self.OpenFileMapping.argtypes = [
-            DWORD,
-            BOOL,
-            LPCWSTR
-        ]
-        self.OpenFileMapping.restype = HANDLE
-
-        self.MapViewOfFile = self.kernel32.MapViewOfFile
-        self.MapViewOfFile.argtypes = [
-            HANDLE,
-            DWORD,
-            DWORD,
-            DWORD,
-            c_size_t
-        ]
-        self.MapViewOfFile.restype = c_void_p
-
-        self.UnmapViewOfFile = self.kernel32.UnmapViewOfFile
-        self.UnmapViewOfFile.argtypes = [c_void_p]
-        self.UnmapViewOfFile.restype = BOOL
-
-        self.CloseHandle = self.kernel32.CloseHandle
-        self.CloseHandle.argtypes = [HANDLE]
-        self.CloseHandle.restype = BOOL
-
-        self.GetLastError = GetLastError
-        self.FormatMessage = self.kernel32.FormatMessageW
-
-    def get_last_error(self) -> str:
-        """Get formatted Windows error message.
+    """Windows API wrapper for shared memory operations.
 
-        Returns:
-            str: Formatted error message.
-        """
-        error_code = self.GetLastError()
-        if error_code == 0:
-            return "No error"
-
-        # Format the error message
-        buffer = create_unicode_buffer(256)
-        self.FormatMessage(
-            0x00001000,  # FORMAT_MESSAGE_FROM_SYSTEM
-            None,
-            error_code,
-            0,
-            buffer,
-            len(buffer),
-            None
-        )
+    The functions are bound once at module level; instances only expose
+    them under their Windows names.
+    """
+
+    OpenFileMapping = _OPEN_FILE_MAPPING
+    MapViewOfFile = _MAP_VIEW_OF_FILE
+    MapViewOfFileEx = _MAP_VIEW_OF_FILE_EX
+    UnmapViewOfFile = _UNMAP_VIEW_OF_FILE
+    CloseHandle = _CLOSE_HANDLE
+    FormatMessage = _FORMAT_MESSAGE
+    kernel32 = _KERNEL32
+
+    # Plain functions stored on the class would be bound as methods
+    GetLastError = staticmethod(get_last_error)
+    get_last_error = staticmethod(_last_error)
+    format_error = staticmethod(_format_error)
+    map_view = staticmethod(_map_view)
 
-        return f"Error {error_code}: {buffer.value.strip()}"
 
 class PluginConnection:
     """Manages shared memory connection to BurnInTest.
@@ -90,15 +174,16 @@ class PluginConnection:
         Args:
             logger (logging.Logger | None): Optional logger instance.
         """
-        self._api = WindowsAPI()
         self._logger = logger or logging.getLogger(__name__)
 
         # Connection state
         self._shared_memory_name: str | None = None
         self._file_mapping_handle: int | None = None
         self._mapped_address: int | None = None
+        self._buffer = None
         self._interface: PluginInterface | None = None
         self._is_connected = False
+        self._connection_time: float | None = None
 
     @property
     def is_connected(self) -> bool:
@@ -142,33 +227,37 @@ class PluginConnection:
 
         try:
             # Open file mapping
-            self._file_mapping_handle = self._api.OpenFileMapping(
+            self._file_mapping_handle = _OPEN_FILE_MAPPING(
                 FILE_MAP_ALL_ACCESS, False, shared_memory_name
             )
 
             if not self._file_mapping_handle:
-                error_msg = self._api.get_last_error()
+                error_msg = _last_error()
                 msg = f"Failed to open file mapping: {error_msg}"
                 raise ConnectionError(msg)
 
             self._logger.debug(f"File mapping opened successfully. Handle: {self._file_mapping_handle}")
 
-            # Map view of file
-            self._mapped_address = self._api.MapViewOfFile(
-                self._file_mapping_handle, FILE_MAP_ALL_ACCESS, 0, 0, 0
+            # Map exactly one interface structure rather than the whole mapping
+            self._mapped_address = _map_view(
+                self._file_mapping_handle, FILE_MAP_ALL_ACCESS, _INTERFACE_SIZE
             )
 
             if not self._mapped_address:
-                error_msg = self._api.get_last_error()
+                error_msg = _last_error()
                 self._cleanup_handles()
                 msg = f"Failed to map view of file: {error_msg}"
                 raise ConnectionError(msg)
 
             self._logger.debug(f"View mapped at address: {self._mapped_address}")
 
-            # Create interface structure
+            # Create interface structure over a byte buffer of the mapped view,
+            # so the same memory is also reachable through the buffer protocol
             try:
-                structure = PluginInterfaceStructure.from_address(self._mapped_address)
+                self._buffer = (c_ubyte * _INTERFACE_SIZE).from_address(
+                    self._mapped_address
+                )
+                structure = PluginInterfaceStructure.from_buffer(self._buffer)
                 self._interface = PluginInterface(structure)
             except Exception as e:
                 self._cleanup_handles()
@@ -180,6 +269,7 @@ class PluginConnection:
 
             # Update connection state
             self._is_connected = True
+            self._connection_time = time.monotonic()
 
             self._logger.info(f"Successfully connected to shared memory: {shared_memory_name}")
             return True
@@ -215,6 +305,7 @@ class PluginConnection:
         self._interface = None
         self._is_connected = False
         self._shared_memory_name = None
+        self._connection_time = None
 
         self._logger.info("Disconnected from shared memory")
 
@@ -233,19 +324,42 @@ class PluginConnection:
 
         return self._interface
 
+    def get_buffer(self) -> memoryview:
+        """Get a writable memoryview over the mapped interface structure.
+
+        Writes through the view go straight to shared memory, which allows
+        bulk updates with slice assignment.
+
+        Returns:
+            memoryview: View of sizeof(PluginInterfaceStructure) bytes.
+
+        Raises:
+            ConnectionError: If not connected.
+        """
+        if not self._is_connected or self._buffer is None:
+            msg = "Not connected to shared memory"
+            raise ConnectionError(msg)
+
+        return memoryview(self._buffer)
+
     def _initialize_interface(self) -> None:
         """Initialize interface with default values."""
         if not self._interface:
             return
 
         try:
-            # Set interface version
-            self._interface.interface_version = 4
-
-            # Set initial labels
-            self._interface.write_label = "Write:"
-            self._interface.read_label = "Read:"
-            self._interface.verify_label = "Verify:"
+            # Set interface version and initial labels. These carry no
+            # notification flag, so leave them untouched when a previous
+            # session already wrote the same values.
+            structure = self._interface.get_structure()
+            if structure.OUT_Plugin_interface_version != 4:
+                structure.OUT_Plugin_interface_version = 4
+            if structure.OUT_szWriteOps != _WRITE_LABEL:
+                structure.OUT_szWriteOps = _WRITE_LABEL
+            if structure.OUT_szReadOps != _READ_LABEL:
+                structure.OUT_szReadOps = _READ_LABEL
+            if structure.OUT_szVerifyOps != _VERIFY_LABEL:
+                structure.OUT_szVerifyOps = _VERIFY_LABEL
 
             # Set initial status
             self._interface.status = "Initializing"
@@ -266,11 +380,12 @@ class PluginConnection:
 
     def _cleanup_handles(self) -> None:
         """Clean up Windows API handles."""
+        self._buffer = None
+
         if self._mapped_address:
             try:
-                if not self._api.UnmapViewOfFile(self._mapped_address):
-                    error_msg = self._api.get_last_error()
-                    self._logger.warning(f"Failed to unmap view of file: {error_msg}")
+                if not _UNMAP_VIEW_OF_FILE(self._mapped_address):
+                    self._logger.warning("Failed to unmap view of file: %s", _last_error())
                 else:
                     self._logger.debug("Successfully unmapped view of file")
             except Exception as e:
@@ -280,9 +395,10 @@ class PluginConnection:
 
         if self._file_mapping_handle:
             try:
-                if not self._api.CloseHandle(self._file_mapping_handle):
-                    error_msg = self._api.get_last_error()
-                    self._logger.warning(f"Failed to close file mapping handle: {error_msg}")
+                if not _CLOSE_HANDLE(self._file_mapping_handle):
+                    self._logger.warning(
+                        "Failed to close file mapping handle: %s", _last_error()
+                    )
                 else:
                     self._logger.debug("Successfully closed file mapping handle")
             except Exception as e:
@@ -323,10 +439,10 @@ class PluginConnection:
         Returns:
             str: Human-readable string representation.
         """
-        if self._is_connected:
+        if self._is_connected and self._connection_time is not None:
             return (
                 f"PluginConnection(connected=True, name='{self._shared_memory_name}', "
-                f"connected_time={time.time() - self._connection_time:.1f}s)"
+                f"connected_time={time.monotonic() - self._connection_time:.1f}s)"
             )
         else:
             return "PluginConnection(connected=False)"
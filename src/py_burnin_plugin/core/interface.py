@@ -1,18 +1,30 @@
-from ctypes import Structure, c_bool, c_char, c_int, c_int64, c_uint
-from datetime import datetime
+import functools
+import platform
+import sys
+import time
+from dataclasses import dataclass
+from ctypes import Structure, addressof, c_bool, c_char, c_int, c_int64, c_uint, c_uint32, memmove, sizeof
 
 from .common import (
     PLUGIN_MAXDISPLAYTEXT,
     PLUGIN_MAXERRORTEXT,
     PLUGIN_MAXERRORTEXTLONG,
     ErrorSeverity,
+    InterfaceError,
     StatusCode,
     ValidationError,
 )
+from ..utils.string_utils import strn_clean_cpy
 
 
 class PluginInterfaceStructure(Structure):
-#    _pack_ = 1  # Prevent padding between fields
+    """Mirror of the PLUGININTERFACE structure shared with BurnInTest.
+
+    The layout is byte packed (no padding between fields) to match the
+    C header. Do not remove _pack_: default alignment would shift every
+    field after the first c_bool and silently corrupt reads and writes.
+    """
+    _pack_ = 1  # Prevent padding between fields
     _fields_ = [
         ("IN_TestRunning", c_int),
         ("IN_DutyCycle", c_int),
@@ -60,11 +72,208 @@ class PluginInterfaceStructure(Structure):
     ]
 
 
+# Packed size of the V4 interface: the sum of all field sizes
+EXPECTED_V4_SIZE = sum(sizeof(field_type) for _, field_type in PluginInterfaceStructure._fields_)
+assert sizeof(PluginInterfaceStructure) == EXPECTED_V4_SIZE, (
+    f"PLUGININTERFACE layout mismatch: {sizeof(PluginInterfaceStructure)} != {EXPECTED_V4_SIZE}"
+)
+
+
+# BurnInTest reads the text fields once it sees the matching notification
+# flag, so every payload write must be visible before the flag store. x86/x64
+# keeps stores in program order; on Windows ARM64 a full barrier is issued
+# before a flag is published. Windows documents its interlocked functions as
+# full barriers, and InterlockedFlushSList is one that kernel32 exports on
+# every architecture (the plain Interlocked* functions are compiler
+# intrinsics). Run on a private list that is always empty, it only orders
+# the calling thread's own stores, unlike FlushProcessWriteBuffers, which
+# interrupts every processor running the process.
+if sys.platform == "win32" and platform.machine().upper() == "ARM64":
+    from ctypes import WinDLL, c_ubyte, c_void_p
+
+    _kernel32 = WinDLL("kernel32")
+    _kernel32.InitializeSListHead.argtypes = [c_void_p]
+    _kernel32.InitializeSListHead.restype = None
+    _kernel32.InterlockedFlushSList.argtypes = [c_void_p]
+    _kernel32.InterlockedFlushSList.restype = c_void_p
+
+    # SLIST_HEADER is 16 bytes and must be 16-byte aligned
+    _SLIST_BUF = (c_ubyte * 32)()
+    _SLIST_HEAD = (addressof(_SLIST_BUF) + 15) & ~15
+    _kernel32.InitializeSListHead(_SLIST_HEAD)
+
+    def _memory_barrier() -> None:
+        """Issue a full memory barrier through an interlocked operation."""
+        _kernel32.InterlockedFlushSList(_SLIST_HEAD)
+else:
+    def _memory_barrier() -> None:
+        """No barrier needed, stores are not reordered on this platform."""
+
+
+def _store_release(flag: c_bool, value: bool = True) -> None:
+    """Store a notification flag after all preceding payload writes.
+
+    Args:
+        flag (c_bool): View bound to the flag field in shared memory.
+        value (bool): Value to store.
+    """
+    _memory_barrier()
+    flag.value = value
+
+
+@functools.lru_cache(maxsize=256)
+def _enc(text: str) -> bytes:
+    """Encode text to UTF-8, memoised for the small set of recurring labels."""
+    return text.encode('utf-8')
+
+
+# Backoff bounds (seconds) when waiting for BurnInTest to acknowledge a flag
+FLAG_POLL_MIN_DELAY = 0.001
+FLAG_POLL_MAX_DELAY = 0.05
+
+# Byte offsets of the frequently written text fields, resolved once so the
+# setters can memmove straight into shared memory
+_STATUS_OFFSET = PluginInterfaceStructure.OUT_szStatus.offset
+_ERROR_OFFSET = PluginInterfaceStructure.OUT_szError.offset
+_WINDOW_TITLE_OFFSET = PluginInterfaceStructure.OUT_szWindowTitle.offset
+
+# The notification flags cleared by reset_flags, in structure order
+_RESET_FLAGS = (
+    "OUT_bNewError",
+    "OUT_bNewStatus",
+    "OUT_bNewUserDefVal1",
+    "OUT_bNewUserDefVal2",
+)
+_FLAGS_OFFSET = getattr(PluginInterfaceStructure, _RESET_FLAGS[0]).offset
+_FLAGS_SPAN = getattr(PluginInterfaceStructure, _RESET_FLAGS[-1]).offset + sizeof(c_bool) - _FLAGS_OFFSET
+# True when the four flags are adjacent bytes that one 32-bit view covers
+_FLAGS_CONTIGUOUS = _FLAGS_SPAN == len(_RESET_FLAGS) * sizeof(c_bool) == sizeof(c_uint32)
+
+# Per user-defined field (index field_id - 1): label and value field names,
+# then the label, value and enabled field descriptors, then the attribute
+# holding the new-value flag view. Only fields 1 and 2 have a new-value flag.
+_USER_FIELDS = tuple(
+    (
+        f"OUT_szUserDef{i}",
+        f"OUT_szUserDefVal{i}",
+        getattr(PluginInterfaceStructure, f"OUT_szUserDef{i}"),
+        getattr(PluginInterfaceStructure, f"OUT_szUserDefVal{i}"),
+        getattr(PluginInterfaceStructure, f"OUT_bUserDef{i}"),
+        f"_new_user_value{i}" if i <= 2 else None,
+    )
+    for i in range(1, 7)
+)
+
+
+
+def _make_validator(what: str, max_len: int):
+    """Build a text validator with its name and length bound in the closure.
+
+    Args:
+        what (str): Name used in error messages, e.g. "Label".
+        max_len (int): Size of the target field including the terminator.
+
+    Returns:
+        Callable[[str], None]: Validator raising ValidationError when the
+        text is not a string or does not fit in the field.
+    """
+    type_msg = f"{what} must be a string"
+    len_msg = f"{what} must be less than {max_len} characters"
+
+    def validate(text: str) -> None:
+        if not isinstance(text, str):
+            raise ValidationError(type_msg)
+        if len(text) >= max_len:
+            raise ValidationError(len_msg)
+
+    return validate
+
+
+# Enum members by integer value, for getters and setter validation
+_STATUS_LOOKUP = {member.value: member for member in StatusCode}
+_SEVERITY_LOOKUP = {member.value: member for member in ErrorSeverity}
+
+_validate_label = _make_validator("Label", PLUGIN_MAXDISPLAYTEXT)
+_validate_status = _make_validator("Status", PLUGIN_MAXDISPLAYTEXT)
+_validate_error_long = _make_validator("Error message", PLUGIN_MAXERRORTEXTLONG)
+
+# Scalar fields read and written through views bound at a fixed address
+# instead of the Structure descriptors: (attribute name, structure field)
+_VIEW_FIELDS = (
+    # Inputs polled by the plugin loop
+    ("_test_running", "IN_TestRunning"),
+    ("_duty_cycle", "IN_DutyCycle"),
+    # Cycle, operation and error counters
+    ("_cycle", "OUT_iCycle"),
+    ("_write_ops", "OUT_i64WriteOps"),
+    ("_read_ops", "OUT_i64ReadOps"),
+    ("_verify_ops", "OUT_i64VerifyOps"),
+    ("_error_count", "OUT_iErrorCount"),
+    # Status and display text notification
+    ("_status_code", "OUT_iStatus"),
+    ("_new_status", "OUT_bNewStatus"),
+    ("_display_text_set", "OUT_bDisplayTextSet"),
+    # User-defined value notification
+    ("_new_user_value1", "OUT_bNewUserDefVal1"),
+    ("_new_user_value2", "OUT_bNewUserDefVal2"),
+    # Error reporting
+    ("_error_severity", "OUT_iErrorSeverity"),
+    ("_new_error", "OUT_bNewError"),
+)
+
+# (attribute name, ctypes type, byte offset) for each view, resolved once
+_FIELD_TYPES = dict(PluginInterfaceStructure._fields_)
+_VIEW_LAYOUT = tuple(
+    (attr, _FIELD_TYPES[field], getattr(PluginInterfaceStructure, field).offset)
+    for attr, field in _VIEW_FIELDS
+)
+
+
+@dataclass(slots=True)
+class PluginSnapshot:
+    """Decoded copy of every PLUGININTERFACE field taken at one instant.
+
+    Produced by PluginInterface.snapshot() and snapshot_into(). Status code
+    and severity are enum members, or the raw integer if shared memory
+    holds a value the enum does not define.
+    """
+
+    test_running: bool = False
+    duty_cycle: int = 0
+    interface_version: int = 0
+    window_title: str = ""
+    cycle: int = 0
+    status_code: StatusCode | int = 0
+    status: str = ""
+    error_count: int = 0
+    error_message: str = ""
+    error_severity: ErrorSeverity | int = 0
+    error_long: str = ""
+    write_label: str = ""
+    write_operations: int = 0
+    read_label: str = ""
+    read_operations: int = 0
+    verify_label: str = ""
+    verify_operations: int = 0
+    # (label, value, enabled) for user-defined fields 1-6
+    user_fields: tuple[tuple[str, str, bool], ...] = ()
+    display_text_set: bool = False
+    new_error: bool = False
+    new_status: bool = False
+    new_user_value1: bool = False
+    new_user_value2: bool = False
+    test_stopped: bool = False
+
+
 class PluginInterface:
     """High-level interface for BurnInTest PLUGININTERFACE structure.
 
     Provides type-safe methods for accessing and manipulating shared memory
     fields with proper validation and error handling.
+
+    Frequently used fields are accessed through ctypes views bound to their
+    fixed byte offsets in shared memory rather than through the Structure
+    field descriptors.
     """
 
     def __init__(self, structure: PluginInterfaceStructure) -> None:
@@ -81,19 +290,46 @@ class PluginInterface:
             raise ValidationError(msg)
 
         self._struct = structure
-        self._last_status_update = datetime.now()
-        self._last_error_update = datetime.now()
+        self._base = addressof(structure)
+
+        # Bind a ctypes view to every scalar field accessed on the hot path
+        for attr, field_type, offset in _VIEW_LAYOUT:
+            setattr(self, attr, field_type.from_address(self._base + offset))
+
+        # All four notification flags read or cleared as one 32-bit value
+        self._pending_flags = (
+            c_uint32.from_address(self._base + _FLAGS_OFFSET) if _FLAGS_CONTIGUOUS else None
+        )
+
+        # Monotonic timestamps (ns) of the last status and error updates
+        self._last_status_update = time.monotonic_ns()
+        self._last_error_update = time.monotonic_ns()
+
+        # Last raw bytes and decoded text per char field, see _decode()
+        self._str_cache: dict[str, tuple[bytes, str]] = {}
+
+        # Private copy of the structure filled by snapshot_into
+        self._snapshot_buf = PluginInterfaceStructure()
 
     # Input properties (read-only)
     @property
     def test_running(self) -> bool:
         """Check if BurnInTest is currently running tests."""
-        return bool(self._struct.IN_TestRunning)
+        return bool(self._test_running.value)
+
+    @property
+    def test_running_flag(self) -> c_int:
+        """Get the ctypes view bound to IN_TestRunning.
+
+        Reading .value on the view is a single load from shared memory,
+        for loops that poll the flag on every iteration.
+        """
+        return self._test_running
 
     @property
     def duty_cycle(self) -> int:
         """Get current duty cycle percentage (0-100)."""
-        return self._struct.IN_DutyCycle
+        return self._duty_cycle.value
 
     # Output properties (read/write)
     @property
@@ -112,7 +348,7 @@ class PluginInterface:
     @property
     def cycle(self) -> int:
         """Get current test cycle number."""
-        return self._struct.OUT_iCycle
+        return self._cycle.value
 
     @cycle.setter
     def cycle(self, cycle: int) -> None:
@@ -124,13 +360,13 @@ class PluginInterface:
 
     def increment_cycle(self) -> None:
         """Increment current test cycle number."""
-        self._struct.OUT_iCycle += 1
+        self._cycle.value += 1
 
 
     @property
     def status(self) -> str:
         """Get current status text."""
-        return self._struct.OUT_szStatus.decode('utf-8', errors='ignore').rstrip('\x00')
+        return self._decode("OUT_szStatus", self._struct.OUT_szStatus)
 
     @status.setter
     def status(self, status: str) -> None:
@@ -142,35 +378,79 @@ class PluginInterface:
         Raises:
             ValidationError: If status is too long.
         """
-        if not isinstance(status, str):
-            msg = "Status must be a string"
+        _validate_status(status)
+        self._write_text(_STATUS_OFFSET, PLUGIN_MAXDISPLAYTEXT, status)
+        _store_release(self._new_status)
+        self._last_status_update = time.monotonic_ns()
+
+    def write_status_blob(self, blob: bytes) -> None:
+        """Write a prepared status text blob straight into shared memory.
+
+        Args:
+            blob (bytes): Cleaned, NUL padded status text of exactly
+                PLUGIN_MAXDISPLAYTEXT bytes (see utils.clean_and_pad).
+
+        Raises:
+            ValidationError: If blob has the wrong size.
+        """
+        if len(blob) != PLUGIN_MAXDISPLAYTEXT:
+            msg = f"Status blob must be exactly {PLUGIN_MAXDISPLAYTEXT} bytes"
+            raise ValidationError(msg)
+
+        memmove(self._base + _STATUS_OFFSET, blob, PLUGIN_MAXDISPLAYTEXT)
+        _store_release(self._new_status)
+        self._last_status_update = time.monotonic_ns()
+
+    def set_status(self, code: StatusCode | int, blob: bytes) -> None:
+        """Set status code and prepared status text in one call.
+
+        Args:
+            code (StatusCode | int): New status code.
+            blob (bytes): Cleaned, NUL padded status text of exactly
+                PLUGIN_MAXDISPLAYTEXT bytes (see utils.clean_and_pad).
+
+        Raises:
+            ValidationError: If code is not a valid status code or blob has the wrong size.
+        """
+        if not isinstance(code, int) or code not in _STATUS_LOOKUP:
+            msg = "Status code must be a StatusCode value"
             raise ValidationError(msg)
 
-        if len(status) >= PLUGIN_MAXDISPLAYTEXT:
-            msg = f"Status must be less than {PLUGIN_MAXDISPLAYTEXT} characters"
+        if len(blob) != PLUGIN_MAXDISPLAYTEXT:
+            msg = f"Status blob must be exactly {PLUGIN_MAXDISPLAYTEXT} bytes"
             raise ValidationError(msg)
 
-        self._struct.OUT_szStatus = status.encode()
-        self._struct.OUT_bNewStatus = True
-        self._last_status_update = datetime.now()
+        self._status_code.value = code
+        memmove(self._base + _STATUS_OFFSET, blob, PLUGIN_MAXDISPLAYTEXT)
+        _store_release(self._new_status)
+        self._last_status_update = time.monotonic_ns()
+
+    @property
+    def status_code_int(self) -> int:
+        """Get current status code as a plain integer."""
+        return self._status_code.value
 
     @property
     def status_code(self) -> StatusCode:
         """Get current status code."""
-        return StatusCode(self._struct.OUT_iStatus)
+        value = self._status_code.value
+        try:
+            return _STATUS_LOOKUP[value]
+        except KeyError:
+            return StatusCode(value)
 
     @status_code.setter
-    def status_code(self, code: StatusCode) -> None:
-        """Set current status code."""
-        if not isinstance(code, StatusCode):
-            msg = "Status code must be a StatusCode enum value"
+    def status_code(self, code: StatusCode | int) -> None:
+        """Set current status code (a StatusCode or its integer value)."""
+        if not isinstance(code, int) or code not in _STATUS_LOOKUP:
+            msg = "Status code must be a StatusCode value"
             raise ValidationError(msg)
-        self._struct.OUT_iStatus = code.value
+        self._status_code.value = code
 
     @property
     def error_count(self) -> int:
         """Get total error count."""
-        return self._struct.OUT_iErrorCount
+        return self._error_count.value
 
     @error_count.setter
     def error_count(self, count: int) -> None:
@@ -183,7 +463,7 @@ class PluginInterface:
     @property
     def error_message(self) -> str:
         """Get current error message."""
-        return self._struct.OUT_szError.decode('utf-8', errors='ignore').rstrip('\x00')
+        return self._decode("OUT_szError", self._struct.OUT_szError)
 
     @error_message.setter
     def error_message(self, message: str) -> None:
@@ -199,27 +479,55 @@ class PluginInterface:
             msg = "Error message must be a string"
             raise ValidationError(msg)
 
-        self._struct.OUT_szError = message[:PLUGIN_MAXERRORTEXT].encode()
-        self._struct.OUT_bNewError = True
-        self._last_error_update = datetime.now()
+        self._write_text(_ERROR_OFFSET, PLUGIN_MAXERRORTEXT, message)
+        _store_release(self._new_error)
+        self._last_error_update = time.monotonic_ns()
+
+    def set_error_blob(self, blob: bytes, severity: ErrorSeverity | int) -> None:
+        """Set a prepared error message and its severity in one call.
+
+        Args:
+            blob (bytes): Cleaned, NUL padded error text of exactly
+                PLUGIN_MAXERRORTEXT bytes (see utils.clean_and_pad).
+            severity (ErrorSeverity | int): Error severity.
+
+        Raises:
+            ValidationError: If severity is not a valid severity or blob has the wrong size.
+        """
+        if not isinstance(severity, int) or severity not in _SEVERITY_LOOKUP:
+            msg = "Error severity must be an ErrorSeverity value"
+            raise ValidationError(msg)
+
+        if len(blob) != PLUGIN_MAXERRORTEXT:
+            msg = f"Error blob must be exactly {PLUGIN_MAXERRORTEXT} bytes"
+            raise ValidationError(msg)
+
+        memmove(self._base + _ERROR_OFFSET, blob, PLUGIN_MAXERRORTEXT)
+        self._error_severity.value = severity
+        _store_release(self._new_error)
+        self._last_error_update = time.monotonic_ns()
 
     @property
     def error_severity(self) -> ErrorSeverity:
         """Get current error severity."""
-        return ErrorSeverity(self._struct.OUT_iErrorSeverity)
+        value = self._error_severity.value
+        try:
+            return _SEVERITY_LOOKUP[value]
+        except KeyError:
+            return ErrorSeverity(value)
 
     @error_severity.setter
-    def error_severity(self, severity: ErrorSeverity) -> None:
-        """Set current error severity."""
-        if not isinstance(severity, ErrorSeverity):
-            msg = "Error severity must be an ErrorSeverity enum value"
+    def error_severity(self, severity: ErrorSeverity | int) -> None:
+        """Set current error severity (an ErrorSeverity or its integer value)."""
+        if not isinstance(severity, int) or severity not in _SEVERITY_LOOKUP:
+            msg = "Error severity must be an ErrorSeverity value"
             raise ValidationError(msg)
-        self._struct.OUT_iErrorSeverity = severity.value
+        self._error_severity.value = severity
 
     @property
     def error_long(self) -> str:
         """Get long error message."""
-        return self._struct.OUT_szErrorLong.decode('utf-8', errors='ignore').rstrip('\x00')
+        return self._decode("OUT_szErrorLong", self._struct.OUT_szErrorLong)
 
     @error_long.setter
     def error_long(self, message: str) -> None:
@@ -231,21 +539,14 @@ class PluginInterface:
         Raises:
             ValidationError: If message is too long.
         """
-        if not isinstance(message, str):
-            msg = "Error message must be a string"
-            raise ValidationError(msg)
-
-        if len(message) >= PLUGIN_MAXERRORTEXTLONG:
-            msg = f"Error message must be less than {PLUGIN_MAXERRORTEXTLONG} characters"
-            raise ValidationError(msg)
-
-        self._struct.OUT_szErrorLong = message.encode()
+        _validate_error_long(message)
+        self._struct.OUT_szErrorLong = _enc(message)
 
     # Operation metrics
     @property
     def write_operations(self) -> int:
         """Get write operation count."""
-        return self._struct.OUT_i64WriteOps
+        return self._write_ops.value
 
     @write_operations.setter
     def write_operations(self, count: int) -> None:
@@ -258,7 +559,7 @@ class PluginInterface:
     @property
     def read_operations(self) -> int:
         """Get read operation count."""
-        return self._struct.OUT_i64ReadOps
+        return self._read_ops.value
 
     @read_operations.setter
     def read_operations(self, count: int) -> None:
@@ -271,7 +572,7 @@ class PluginInterface:
     @property
     def verify_operations(self) -> int:
         """Get verify operation count."""
-        return self._struct.OUT_i64VerifyOps
+        return self._verify_ops.value
 
     @verify_operations.setter
     def verify_operations(self, count: int) -> None:
@@ -285,36 +586,36 @@ class PluginInterface:
     @property
     def write_label(self) -> str:
         """Get write operation label."""
-        return self._struct.OUT_szWriteOps.decode('utf-8', errors='ignore').rstrip('\x00')
+        return self._decode("OUT_szWriteOps", self._struct.OUT_szWriteOps)
 
     @write_label.setter
     def write_label(self, label: str) -> None:
         """Set write operation label."""
-        self._validate_label(label)
-        self._struct.OUT_szWriteOps = label.encode()
+        _validate_label(label)
+        self._struct.OUT_szWriteOps = _enc(label)
 
     @property
     def read_label(self) -> str:
         """Get read operation label."""
-        return self._struct.OUT_szReadOps.decode('utf-8', errors='ignore').rstrip('\x00')
+        return self._decode("OUT_szReadOps", self._struct.OUT_szReadOps)
 
     @read_label.setter
     def read_label(self, label: str) -> None:
         """Set read operation label."""
-        self._validate_label(label)
-        self._struct.OUT_szReadOps = label.encode()
+        _validate_label(label)
+        self._struct.OUT_szReadOps = _enc(label)
 
 
     @property
     def verify_label(self) -> str:
         """Get verify operation label."""
-        return self._struct.OUT_szVerifyOps.decode('utf-8', errors='ignore').rstrip('\x00')
+        return self._decode("OUT_szVerifyOps", self._struct.OUT_szVerifyOps)
 
     @verify_label.setter
     def verify_label(self, label: str) -> None:
         """Set verify operation label."""
-        self._validate_label(label)
-        self._struct.OUT_szVerifyOps = label.encode()
+        _validate_label(label)
+        self._struct.OUT_szVerifyOps = _enc(label)
 
 
     # User-defined fields
@@ -334,30 +635,23 @@ class PluginInterface:
             msg = "Field ID must be between 1 and 6"
             raise ValidationError(msg)
 
-        field_map = {
-            1: ("OUT_szUserDef1", "OUT_szUserDefVal1", "OUT_bUserDef1"),
-            2: ("OUT_szUserDef2", "OUT_szUserDefVal2", "OUT_bUserDef2"),
-            3: ("OUT_szUserDef3", "OUT_szUserDefVal3", "OUT_bUserDef3"),
-            4: ("OUT_szUserDef4", "OUT_szUserDefVal4", "OUT_bUserDef4"),
-            5: ("OUT_szUserDef5", "OUT_szUserDefVal5", "OUT_bUserDef5"),
-            6: ("OUT_szUserDef6", "OUT_szUserDefVal6", "OUT_bUserDef6"),
-        }
-
-        label_attr, value_attr, enabled_attr = field_map[field_id]
+        label_name, value_name, label_field, value_field, enabled_field, _ = _USER_FIELDS[field_id - 1]
+        struct = self._struct
 
         return {
-            "label": getattr(self._struct, label_attr).decode('utf-8', errors='ignore').rstrip('\x00'),
-            "value": getattr(self._struct, value_attr).decode('utf-8', errors='ignore').rstrip('\x00'),
-            "enabled": bool(getattr(self._struct, enabled_attr)),
+            "label": self._decode(label_name, label_field.__get__(struct)),
+            "value": self._decode(value_name, value_field.__get__(struct)),
+            "enabled": bool(enabled_field.__get__(struct)),
         }
 
-    def set_user_field(self, field_id: int, label: str, value: str, enabled: bool = True) -> None:
+    def set_user_field(self, field_id: int, label: str, value: str | bytes, enabled: bool = True) -> None:
         """Set user-defined field configuration and value.
 
         Args:
             field_id (int): Field ID (1-6).
             label (str): Field label (max 19 characters).
-            value (str): Field value (max 19 characters).
+            value (str | bytes): Field value (max 19 characters). Bytes are
+                written without re-encoding.
             enabled (bool): Whether field is enabled.
 
         Raises:
@@ -367,48 +661,89 @@ class PluginInterface:
             msg = "Field ID must be between 1 and 6"
             raise ValidationError(msg)
 
+        _, _, label_field, value_field, enabled_field, new_value_flag = _USER_FIELDS[field_id - 1]
+        struct = self._struct
 
-        field_map = {
-            1: ("OUT_szUserDef1", "OUT_szUserDefVal1", "OUT_bUserDef1", "OUT_bNewUserDefVal1"),
-            2: ("OUT_szUserDef2", "OUT_szUserDefVal2", "OUT_bUserDef2", "OUT_bNewUserDefVal2"),
-            3: ("OUT_szUserDef3", "OUT_szUserDefVal3", "OUT_bUserDef3", None),
-            4: ("OUT_szUserDef4", "OUT_szUserDefVal4", "OUT_bUserDef4", None),
-            5: ("OUT_szUserDef5", "OUT_szUserDefVal5", "OUT_bUserDef5", None),
-            6: ("OUT_szUserDef6", "OUT_szUserDefVal6", "OUT_bUserDef6", None),
-        }
-
-        label_attr, value_attr, enabled_attr, new_value_attr = field_map[field_id]
-
-        setattr(self._struct, label_attr, label.encode())
-        setattr(self._struct, value_attr, value.encode())
+        label_field.__set__(struct, _enc(label))
+        self._write_text(value_field.offset, PLUGIN_MAXDISPLAYTEXT, value)
 
-        setattr(self._struct, enabled_attr, enabled)
+        enabled_field.__set__(struct, enabled)
 
         # Set new value flag for fields 1 and 2
-        if new_value_attr is not None:
-            setattr(self._struct, new_value_attr, True)
+        if new_value_flag is not None:
+            _store_release(getattr(self, new_value_flag))
 
     # Display and window management
     @property
     def window_title(self) -> str:
         """Get window title."""
-        return self._struct.OUT_szWindowTitle.decode('utf-8', errors='ignore').rstrip('\x00')
+        return self._decode("OUT_szWindowTitle", self._struct.OUT_szWindowTitle)
 
     @window_title.setter
     def window_title(self, title: str) -> None:
         """Set window title."""
-        self._validate_label(title)
-        self._struct.OUT_szWindowTitle = title.encode()
+        _validate_label(title)
+        self._write_text(_WINDOW_TITLE_OFFSET, PLUGIN_MAXDISPLAYTEXT, title)
 
     @property
     def display_text_set(self) -> bool:
         """Check if display text has been set."""
-        return bool(self._struct.OUT_bDisplayTextSet)
+        return bool(self._display_text_set.value)
 
     @display_text_set.setter
     def display_text_set(self, set_flag: bool) -> None:
         """Set display text flag."""
-        self._struct.OUT_bDisplayTextSet = set_flag
+        _store_release(self._display_text_set, set_flag)
+
+    def set_display_text(self, title_blob: bytes, status_blob: bytes) -> None:
+        """Replace window title and status text and notify BurnInTest.
+
+        Both texts are copied with one memmove each, then the new-status and
+        display text flags are raised. The two fields are not contiguous
+        (the cycle counter and status code sit between them), so they are
+        written separately.
+
+        Args:
+            title_blob (bytes): Cleaned, NUL padded window title of exactly
+                PLUGIN_MAXDISPLAYTEXT bytes (see utils.clean_and_pad).
+            status_blob (bytes): Cleaned, NUL padded status text of exactly
+                PLUGIN_MAXDISPLAYTEXT bytes.
+
+        Raises:
+            ValidationError: If either blob has the wrong size.
+        """
+        if len(title_blob) != PLUGIN_MAXDISPLAYTEXT or len(status_blob) != PLUGIN_MAXDISPLAYTEXT:
+            msg = f"Display text blobs must be exactly {PLUGIN_MAXDISPLAYTEXT} bytes"
+            raise ValidationError(msg)
+
+        memmove(self._base + _WINDOW_TITLE_OFFSET, title_blob, PLUGIN_MAXDISPLAYTEXT)
+        memmove(self._base + _STATUS_OFFSET, status_blob, PLUGIN_MAXDISPLAYTEXT)
+        _store_release(self._new_status)
+        self._last_status_update = time.monotonic_ns()
+        _store_release(self._display_text_set)
+
+    def wait_display_text_cleared(self, timeout: float = 5.0) -> None:
+        """Wait until BurnInTest has consumed the last display text update.
+
+        Polls the display text flag with exponential backoff, starting at
+        1 ms and doubling up to 50 ms, so a fast host is noticed quickly
+        and a slow one is not polled aggressively.
+
+        Args:
+            timeout (float): Maximum time to wait in seconds.
+
+        Raises:
+            InterfaceError: If the flag is still set after timeout seconds.
+        """
+        delay = FLAG_POLL_MIN_DELAY
+        start = time.monotonic()
+        display_text_set = self._display_text_set
+        while display_text_set.value:
+            if time.monotonic() - start > timeout:
+                msg = f"Display text flag not cleared within {timeout}s"
+                raise InterfaceError(msg)
+            time.sleep(delay)
+            delay = min(delay * 2, FLAG_POLL_MAX_DELAY)
 
     @property
     def test_stopped(self) -> bool:
@@ -463,41 +798,124 @@ class PluginInterface:
             read_ops (int): Read operations to add.
             verify_ops (int): Verify operations to add.
             error_count (int): Error count to add.
+
+        Arguments are only type-checked when running without -O; callers are
+        responsible for passing non-negative ints.
         """
+        if __debug__:
+            for delta in (write_ops, read_ops, verify_ops, error_count):
+                assert isinstance(delta, int) and delta >= 0, f"Invalid metric increment: {delta!r}"
+
         if write_ops > 0:
-            self.write_operations += write_ops
+            self._write_ops.value += write_ops
         if read_ops > 0:
-            self.read_operations += read_ops
+            self._read_ops.value += read_ops
         if verify_ops > 0:
-            self.verify_operations += verify_ops
+            self._verify_ops.value += verify_ops
         if error_count > 0:
-            self.error_count += error_count
-
+            self._error_count.value += error_count
 
     def reset_flags(self) -> None:
         """Reset all notification flags."""
-        self._struct.OUT_bNewError = False
-        self._struct.OUT_bNewStatus = False
-        self._struct.OUT_bNewUserDefVal1 = False
-        self._struct.OUT_bNewUserDefVal2 = False
+        if self._pending_flags is not None:
+            self._pending_flags.value = 0
+        else:
+            for name in _RESET_FLAGS:
+                setattr(self._struct, name, False)
+
+    def has_pending_notifications(self) -> bool:
+        """Check whether any notification flag cleared by reset_flags is set.
+
+        Returns:
+            bool: True if a new error, status or user value is pending.
+        """
+        if self._pending_flags is not None:
+            return self._pending_flags.value != 0
+        struct = self._struct
+        return any(getattr(struct, name) for name in _RESET_FLAGS)
+
+    def snapshot(self) -> PluginSnapshot:
+        """Copy the whole structure in one memmove and decode every field.
+
+        Returns:
+            PluginSnapshot: Decoded field values.
+        """
+        snap = PluginSnapshot()
+        self.snapshot_into(snap)
+        return snap
+
+    def snapshot_into(self, out: PluginSnapshot) -> None:
+        """Fill an existing snapshot, avoiding a new allocation per poll.
+
+        Args:
+            out (PluginSnapshot): Snapshot to overwrite.
+        """
+        local = self._snapshot_buf
+        memmove(addressof(local), self._base, EXPECTED_V4_SIZE)
+        decode = self._decode
+
+        out.test_running = bool(local.IN_TestRunning)
+        out.duty_cycle = local.IN_DutyCycle
+        out.interface_version = local.OUT_Plugin_interface_version
+        out.window_title = decode("OUT_szWindowTitle", local.OUT_szWindowTitle)
+        out.cycle = local.OUT_iCycle
+        out.status_code = _STATUS_LOOKUP.get(local.OUT_iStatus, local.OUT_iStatus)
+        out.status = decode("OUT_szStatus", local.OUT_szStatus)
+        out.error_count = local.OUT_iErrorCount
+        out.error_message = decode("OUT_szError", local.OUT_szError)
+        out.error_severity = _SEVERITY_LOOKUP.get(local.OUT_iErrorSeverity, local.OUT_iErrorSeverity)
+        out.error_long = decode("OUT_szErrorLong", local.OUT_szErrorLong)
+        out.write_label = decode("OUT_szWriteOps", local.OUT_szWriteOps)
+        out.write_operations = local.OUT_i64WriteOps
+        out.read_label = decode("OUT_szReadOps", local.OUT_szReadOps)
+        out.read_operations = local.OUT_i64ReadOps
+        out.verify_label = decode("OUT_szVerifyOps", local.OUT_szVerifyOps)
+        out.verify_operations = local.OUT_i64VerifyOps
+        out.user_fields = tuple(
+            (
+                decode(label_name, label_field.__get__(local)),
+                decode(value_name, value_field.__get__(local)),
+                bool(enabled_field.__get__(local)),
+            )
+            for label_name, value_name, label_field, value_field, enabled_field, _ in _USER_FIELDS
+        )
+        out.display_text_set = bool(local.OUT_bDisplayTextSet)
+        out.new_error = bool(local.OUT_bNewError)
+        out.new_status = bool(local.OUT_bNewStatus)
+        out.new_user_value1 = bool(local.OUT_bNewUserDefVal1)
+        out.new_user_value2 = bool(local.OUT_bNewUserDefVal2)
+        out.test_stopped = bool(local.OUT_bTestStopped)
 
     # Private helper methods
-    def _validate_label(self, label: str) -> None:
-        """Validate label string.
+    def _decode(self, field: str, raw: bytes) -> str:
+        """Decode a char field, reusing the last result if its bytes are unchanged.
 
         Args:
-            label (str): Label to validate.
+            field (str): Structure field name, used as cache key.
+            raw (bytes): Current contents of the field.
 
-        Raises:
-            ValidationError: If label is invalid.
+        Returns:
+            str: Decoded text without trailing NULs.
         """
-        if not isinstance(label, str):
-            msg = "Label must be a string"
-            raise ValidationError(msg)
+        cached = self._str_cache.get(field)
+        if cached is not None and cached[0] == raw:
+            return cached[1]
 
-        if len(label) >= PLUGIN_MAXDISPLAYTEXT:
-            msg = f"Label must be less than {PLUGIN_MAXDISPLAYTEXT} characters"
-            raise ValidationError(msg)
+        text = raw.decode('utf-8', errors='ignore').rstrip('\x00')
+        self._str_cache[field] = (raw, text)
+        return text
+
+    def _write_text(self, offset: int, size: int, text: str | bytes) -> None:
+        """Clean, pad and copy text into a fixed-size char field.
+
+        Args:
+            offset (int): Byte offset of the field in the structure.
+            size (int): Size of the field in bytes.
+            text (str | bytes): Text to write (truncated to size - 1 bytes).
+        """
+        if isinstance(text, str):
+            text = _enc(text)
+        strn_clean_cpy(self._base + offset, text, size)
 
     def get_structure(self) -> PluginInterfaceStructure:
         """Get the underlying PLUGININTERFACE structure.
@@ -4,16 +4,49 @@ Abstract base class for all BurnInTest plugins. Provides the plugin
 lifecycle framework and common functionality.
 """
 
+import functools
 import importlib.metadata
 import json
 import logging
 import os
+import re
 import time
 from abc import ABC, abstractmethod
+from functools import cached_property
+
+try:
+    # Optional faster parser; its JSONDecodeError subclasses json's
+    import orjson
+except ImportError:
+    orjson = None
 
 from ..core.common import ConnectionError, ErrorSeverity, PluginError, StatusCode
 from ..core.connection import PluginConnection
 
+# Parses raw UTF-8 config bytes
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Severity reported when a phase fails
+_CRITICAL = ErrorSeverity.CRITICAL
+
+# Keywords used by _get_error_severity in a single pattern; the name of the
+# matching group selects the severity. No keyword overlaps another, so one
+# finditer pass sees every keyword occurrence.
+_SEVERITY_PATTERN = re.compile(
+    r"(?P<critical>critical|fatal|failed)|(?P<serious>error|exception)|(?P<warning>warning|warn)",
+    re.IGNORECASE,
+)
+_SEVERITY_BY_GROUP = {
+    "critical": _CRITICAL,
+    "serious": ErrorSeverity.SERIOUS,
+    "warning": ErrorSeverity.WARNING,
+}
+
+@functools.lru_cache(maxsize=256)
+def _config_keys(field_name: str) -> tuple[str, ...]:
+    """Split a dotted config field name, memoised for recurring names."""
+    return tuple(field_name.split('.'))
+
 
 class BurnInPlugin(ABC):
     """Abstract base class for BurnInTest plugins.
@@ -44,14 +77,17 @@ class BurnInPlugin(ABC):
         # Plugin state
         self._is_running = False
         self._current_cycle = 0
-        self._start_time: float | None = None
+        # Monotonic start time in nanoseconds, set when the plugin starts
+        self._start_time: int | None = None
 
         self._delay = delay
+        # Seconds the last duty cycle sleep ran past its target
+        self._oversleep = 0.0
 
         # Configuration storage
         self._config = {}
 
-        self._logger.info(f"Plugin '{plugin_name}' initialized")
+        self._logger.info("Plugin '%s' initialized", plugin_name)
 
     @property
     def is_running(self) -> bool:
@@ -63,8 +99,9 @@ class BurnInPlugin(ABC):
         """Get current test cycle number."""
         return self._current_cycle
 
-    @property
+    @cached_property
     def version(self) -> str:
+        """Get the installed py-burnin-plugin version (looked up once)."""
         return importlib.metadata.version("py-burnin-plugin")
 
     def run(self, shared_memory_name: str) -> None:
@@ -80,7 +117,7 @@ class BurnInPlugin(ABC):
         if self._is_running:
             raise PluginError("Plugin is already running")
 
-        self._logger.info(f"Starting plugin '{self.plugin_name}'")
+        self._logger.info("Starting plugin '%s'", self.plugin_name)
 
         try:
             # Establish connection
@@ -96,7 +133,7 @@ class BurnInPlugin(ABC):
             self._interface.interface_version = 4
 
             # Start plugin lifecycle
-            self._start_time = time.time()
+            self._start_time = time.monotonic_ns()
             self._is_running = True
 
             # Call startup hook
@@ -124,46 +161,89 @@ class BurnInPlugin(ABC):
         self.on_stop()
 
     def _run_plugin_loop(self) -> None:
-        """Main plugin execution loop."""
+        """Main plugin execution loop.
+
+        Every iteration is one test cycle: the hooks and phases run even if
+        OUT_iCycle has not changed. BurnInTest does not advance the counter;
+        plugins do so themselves (typically from on_cycle_end), so skipping
+        iterations with an unchanged cycle would stall plugins that never
+        increment it.
+        """
         self._logger.info("Starting plugin execution loop")
 
+        self._oversleep = 0.0
+        iface = self._interface
+        test_running = iface.test_running_flag
+
+        # The default cycle hooks only log at DEBUG level; skip calling them
+        # when they are not overridden and that output would be discarded
+        on_cycle_start = self._resolve_hook("on_cycle_start")
+        on_cycle_end = self._resolve_hook("on_cycle_end")
+
+        # Test phases run each cycle, in order. Like the hooks they are
+        # looked up on the instance once per run, so phases assigned on the
+        # instance are called as well as subclass overrides.
+        phases = (
+            ("Write", self.execute_write_phase),
+            ("Read", self.execute_read_phase),
+            ("Verify", self.execute_verify_phase),
+        )
+
         try:
-            while self._is_running and self._interface.test_running:
+            while self._is_running and test_running.value:
                 # Update cycle counter
-                self._current_cycle = self._interface.cycle
+                self._current_cycle = iface.cycle
 
                 # Execute cycle start hook
-                self.on_cycle_start(self._current_cycle)
+                if on_cycle_start is not None:
+                    on_cycle_start(self._current_cycle)
 
                 # Execute test phases
-                if not self._execute_test_phases():
+                if not self._execute_test_phases(iface, test_running, phases):
                     break
 
                 # Execute cycle end hook
-                self.on_cycle_end(self._current_cycle)
+                if on_cycle_end is not None:
+                    on_cycle_end(self._current_cycle)
 
                 # Handle duty cycle delay
-                self._handle_duty_cycle()
+                self._handle_duty_cycle(iface)
 
         except Exception as e:
             self._logger.exception(f"Error in plugin loop: {e}")
             self.on_error(PluginError(f"Error in plugin loop: {e}"))
             raise
 
-    def _execute_test_phases(self) -> bool:
+    def _resolve_hook(self, name: str):
+        """Get a per-cycle hook to call, or None if calling it has no effect.
+
+        Args:
+            name (str): Name of the hook method.
+
+        Returns:
+            The hook, or None when it is still the default implementation
+            (not overridden by the subclass or assigned on the instance) and
+            DEBUG logging is disabled.
+        """
+        hook = getattr(self, name)
+        if (getattr(hook, "__func__", None) is getattr(BurnInPlugin, name)
+                and not self._logger.isEnabledFor(logging.DEBUG)):
+            return None
+        return hook
+
+    def _execute_test_phases(self, iface, test_running, phases) -> bool:
         """Execute all test phases for current cycle.
 
+        Args:
+            iface (PluginInterface): Interface of the running loop.
+            test_running (c_int): IN_TestRunning view polled by the loop.
+            phases (tuple): (name, phase method) pairs to run in order.
+
         Returns:
             bool: True if all phases executed successfully, False otherwise.
         """
-        phases = [
-            ("Write", self.execute_write_phase),
-            ("Read", self.execute_read_phase),
-            ("Verify", self.execute_verify_phase),
-        ]
-
         for phase, phase_method in phases:
-            if not self._is_running or not self._interface.test_running:
+            if not self._is_running or not test_running.value:
                 return False
 
             self._current_phase = phase
@@ -174,37 +254,48 @@ class BurnInPlugin(ABC):
 
                 if not result:
                     self._logger.error(f"Phase {phase} failed.")
-                    self._interface.set_error(
+                    iface.set_error(
                         f"{phase} phase failed.",
-                        ErrorSeverity.CRITICAL
+                        _CRITICAL
                     )
                     self.on_error(PluginError(f"Phase {phase} failed."))
                     return False
 
-                self._logger.debug(f"Phase {phase} completed.")
+                self._logger.debug("Phase %s completed.", phase)
 
             except Exception as e:
                 self._logger.exception(f"Exception in {phase} phase: {e}")
-                self._interface.set_error(
+                iface.set_error(
                     f"Exception in {phase} phase: {e}",
-                    ErrorSeverity.CRITICAL
+                    _CRITICAL
                 )
                 self.on_error(PluginError(f"Exception in {phase} phase: {e}"))
                 return False
         return True
 
-    def _handle_duty_cycle(self) -> None:
-        """Handle duty cycle timing."""
-        if not self._interface:
+    def _handle_duty_cycle(self, iface) -> None:
+        """Handle duty cycle timing.
+
+        Args:
+            iface (PluginInterface): Interface of the running loop.
+        """
+        if iface is None:
             return
 
-        duty_cycle = self._interface.duty_cycle
-        if duty_cycle < 100:
-            # Calculate sleep time based on duty cycle
-            sleep_time = (100 - duty_cycle) * self._delay  # base for 0% duty cycle
-            if sleep_time > 0:
-                self._logger.debug(f"Duty cycle delay: {sleep_time:.3f}s")
-                time.sleep(sleep_time)
+        # Rest period based on duty cycle, starting once the phases finish
+        duty_cycle = iface.duty_cycle
+        period = (100 - duty_cycle) * self._delay if duty_cycle < 100 else 0.0  # base for 0% duty cycle
+
+        # Shorten this rest by however much the previous one overslept, so
+        # the average rest matches the period. Phase time is not counted.
+        sleep_time = period - self._oversleep
+        if sleep_time > 0:
+            self._logger.debug("Duty cycle delay: %.3fs", sleep_time)
+            deadline = time.monotonic() + sleep_time
+            time.sleep(sleep_time)
+            self._oversleep = min(max(time.monotonic() - deadline, 0.0), period)
+        else:
+            self._oversleep = 0.0
 
     def _get_error_severity(self, error: str | None) -> ErrorSeverity:
         """Determine error severity based on error message.
@@ -218,15 +309,15 @@ class BurnInPlugin(ABC):
         if not error:
             return ErrorSeverity.WARNING
 
-        error_lower = error.lower()
-        if any(keyword in error_lower for keyword in ["critical", "fatal", "failed"]):
-            return ErrorSeverity.CRITICAL
-        elif any(keyword in error_lower for keyword in ["error", "exception"]):
-            return ErrorSeverity.SERIOUS
-        elif any(keyword in error_lower for keyword in ["warning", "warn"]):
-            return ErrorSeverity.WARNING
-        else:
-            return ErrorSeverity.INFORMATION
+        # The most severe keyword anywhere in the message wins
+        severity = ErrorSeverity.INFORMATION
+        for match in _SEVERITY_PATTERN.finditer(error):
+            found = _SEVERITY_BY_GROUP[match.lastgroup]
+            if found is _CRITICAL:
+                return found
+            if found > severity:
+                severity = found
+        return severity
 
     def _cleanup(self) -> None:
         """Cleanup plugin resources."""
@@ -252,11 +343,10 @@ class BurnInPlugin(ABC):
             self._logger.exception(f"Error during cleanup: {e}")
 
         # Log final statistics
-        if self._start_time:
-            runtime = time.time() - self._start_time
+        if self._start_time is not None:
+            runtime = (time.monotonic_ns() - self._start_time) / 1e9
             self._logger.info(
-                f"Plugin finished. Runtime: {runtime:.2f}s, "
-                f"Cycles: {self._current_cycle}"
+                "Plugin finished. Runtime: %.2fs, Cycles: %d", runtime, self._current_cycle
             )
 
     # Abstract methods that must be implemented by subclasses
@@ -265,6 +355,9 @@ class BurnInPlugin(ABC):
     def execute_write_phase(self) -> bool:
         """Execute the write phase of the test.
 
+        The phase methods are looked up once when the plugin loop starts,
+        so a phase replaced on the instance is used from the next run().
+
         Returns:
             bool: True if write phase executed successfully, False otherwise.
         """
@@ -274,6 +367,8 @@ class BurnInPlugin(ABC):
     def execute_read_phase(self) -> bool:
         """Execute the read phase of the test.
 
+        Looked up once when the plugin loop starts, like execute_write_phase.
+
         Returns:
             bool: True if read phase executed successfully, False otherwise.
         """
@@ -283,6 +378,8 @@ class BurnInPlugin(ABC):
     def execute_verify_phase(self) -> bool:
         """Execute the verify phase of the test.
 
+        Looked up once when the plugin loop starts, like execute_write_phase.
+
         Returns:
             bool: True if verify phase executed successfully, False otherwise.
         """
@@ -299,18 +396,24 @@ class BurnInPlugin(ABC):
     def on_cycle_start(self, cycle: int) -> None:
         """Called at the start of each test cycle.
 
+        The hook is looked up once when the plugin loop starts. Replacing it
+        on the instance, or enabling DEBUG logging for the default, takes
+        effect from the next run().
+
         Args:
             cycle (int): Current cycle number.
         """
-        self._logger.debug(f"Cycle {cycle} started")
+        self._logger.debug("Cycle %d started", cycle)
 
     def on_cycle_end(self, cycle: int) -> None:
         """Called at the end of each test cycle.
 
+        Looked up once when the plugin loop starts, like on_cycle_start.
+
         Args:
             cycle (int): Current cycle number.
         """
-        self._logger.debug(f"Cycle {cycle} ended")
+        self._logger.debug("Cycle %d ended", cycle)
 
     def on_error(self, error: PluginError) -> None:
         """Called when an error occurs.
@@ -380,24 +483,24 @@ class BurnInPlugin(ABC):
                 # Use the same directory as the plugin code
                 plugin_dir = os.path.dirname(__file__)
                 config_filename = os.path.join(plugin_dir, "config.json")
-                self._logger.info(f"No config filename provided, using default: {config_filename}")
+                self._logger.info("No config filename provided, using default: %s", config_filename)
             else:
                 # If relative path, make it relative to the plugin directory
                 if not os.path.isabs(config_filename):
                     plugin_dir = os.path.dirname(__file__)
                     config_filename = os.path.join(plugin_dir, config_filename)
 
-            # Check if file exists
-            if not os.path.exists(config_filename):
-                raise FileNotFoundError(f"Configuration file not found: {config_filename}")
-
-            # Load and parse JSON
-            with open(config_filename, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            # Load and parse JSON; a missing file is reported by open itself
+            try:
+                f = open(config_filename, 'rb')
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Configuration file not found: {config_filename}") from None
+            with f:
+                config_data = _json_loads(f.read())
 
             # Store configuration
             self._config = config_data
-            self._logger.info(f"Configuration loaded successfully from: {config_filename}")
+            self._logger.info("Configuration loaded successfully from: %s", config_filename)
 
         except FileNotFoundError as e:
             self._logger.exception(f"Configuration file not found: {e}")
@@ -419,13 +522,14 @@ class BurnInPlugin(ABC):
 
         Returns:
             The field value if found, otherwise the default_value.
+
+        The key path is parsed once per field name, but every call walks
+        self._config as it is now, so changes made in place are seen.
         """
         try:
             # Handle nested field access with dot notation
-            keys = field_name.split('.')
             value = self._config
-
-            for key in keys:
+            for key in _config_keys(field_name):
                 if isinstance(value, dict) and key in value:
                     value = value[key]
                 else:
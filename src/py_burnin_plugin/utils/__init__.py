@@ -1,3 +1,3 @@
-from .string_utils import strn_clean_cpy
+from .string_utils import clean_and_pad, strn_clean_cpy
 
-__all__ = ['strn_clean_cpy']
+__all__ = ['clean_and_pad', 'strn_clean_cpy']
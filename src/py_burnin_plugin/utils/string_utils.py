@@ -1,27 +1,49 @@
-from ctypes import memmove
+from ctypes import c_void_p, cast, memmove, memset
 
+# Maps control characters, '%' and '\\' to a space; all other bytes unchanged
+_CLEAN_TABLE = bytes(
+    0x20 if (c < 0x20 or c in (0x25, 0x5C)) else c for c in range(256)
+)
 
 def strn_clean_cpy(text_out, text_in, max_len):
-    """Replicate the C++ strn_clean_cpy function"""
-    # Convert input to bytes if it's a string
+    """Replicate the C++ strn_clean_cpy function
+
+    text_out may be anything memmove accepts as a destination: a ctypes
+    array, a pointer (c_void_p, c_char_p, POINTER(...)) or an integer
+    address. The cleaned text is copied once and the rest of the field is
+    zeroed in place, without building a padded copy first. Nothing is
+    written when max_len is zero or negative.
+    """
+    if max_len <= 0:
+        return
+
+    cleaned = _clean(text_in, max_len)
+    size = len(cleaned)
+    # Address of the memory text_out refers to: for pointers this is the
+    # pointed-to buffer, not the pointer object itself
+    dest = cast(text_out, c_void_p).value
+    memmove(dest, cleaned, size)
+    memset(dest + size, 0, max_len - size)
+
+
+def clean_and_pad(text_in, max_len):
+    """Clean text the same way strn_clean_cpy does and return the padded bytes.
+
+    The result is exactly max_len bytes and NUL terminated, ready to be
+    copied into a fixed-size char field in one memmove.
+    """
+    return _clean(text_in, max_len).ljust(max_len, b'\0')
+
+
+def _clean(text_in, max_len):
+    """Return the cleaned text, at most max_len - 1 bytes and unpadded."""
     if isinstance(text_in, str):
         text_in = text_in.encode('ascii', 'ignore')
 
-    # Ensure we don't exceed max length
-    text_in = text_in[:max_len-1]
-
-    cleaned = bytearray()
-    for i in range(max_len):
-        if i >= len(text_in):
-            break
-        c = text_in[i]
-        if c == 0 or c == b'\0':
-            break
-        if c < 0x20 or c in (b'%', b'\\'):
-            cleaned.append(ord(' '))
-        else:
-            cleaned.append(c)
-    # Ensure null-termination
-    if len(cleaned) < max_len:
-        cleaned += b'\0' * (max_len - len(cleaned))
-    memmove(text_out, bytes(cleaned), max_len)
+    # Ensure we don't exceed max length, and stop at the first NUL. This must
+    # happen before translating, which would turn the NUL into a space.
+    text_in = bytes(text_in[:max_len-1])
+    nul = text_in.find(b'\0')
+    if nul >= 0:
+        text_in = text_in[:nul]
+    return text_in.translate(_CLEAN_TABLE)
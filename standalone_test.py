@@ -2,11 +2,61 @@ import mmap
 import os
 import subprocess
 import sys
+import threading
 import time
 from ctypes import sizeof
 
 from plugin_interface import PLUGININTERFACE
 
+# Environment variable through which the plugin learns the cycle event name
+CYCLE_EVENT_ENV = "BURNIN_CYCLE_EVENT"
+
+# Longest the monitor blocks before re-checking the keyboard, in milliseconds
+MONITOR_TIMEOUT_MS = 500
+
+
+def create_cycle_event(name):
+    """Create the auto-reset event the plugin signals after each cycle.
+
+    Returns:
+        tuple: (kernel32, handle), or None when named events are unavailable.
+    """
+    try:
+        from ctypes import WinDLL
+        from ctypes.wintypes import BOOL, DWORD, HANDLE, LPCWSTR, LPVOID
+    except ImportError:
+        return None
+
+    kernel32 = WinDLL("kernel32", use_last_error=True)
+    kernel32.CreateEventW.argtypes = [LPVOID, BOOL, BOOL, LPCWSTR]
+    kernel32.CreateEventW.restype = HANDLE
+    kernel32.WaitForSingleObject.argtypes = [HANDLE, DWORD]
+    kernel32.WaitForSingleObject.restype = DWORD
+    kernel32.SetEvent.argtypes = [HANDLE]
+    kernel32.CloseHandle.argtypes = [HANDLE]
+
+    handle = kernel32.CreateEventW(None, False, False, name)
+    if not handle:
+        return None
+    return kernel32, handle
+
+
+def start_key_reader(stop_event, cycle_event):
+    """Watch the keyboard on a daemon thread and set stop_event on 'q'.
+
+    The cycle event is signalled too, so a monitor blocked on it wakes
+    up straight away.
+    """
+    def read_keys():
+        while msvcrt.getch() != b'q':
+            pass
+        stop_event.set()
+        if cycle_event:
+            kernel32, handle = cycle_event
+            kernel32.SetEvent(handle)
+
+    threading.Thread(target=read_keys, daemon=True).start()
+
 
 def simulate_burnin_test():
     """Simulate the BurnInTest application by creating shared memory and starting the plugin"""
@@ -24,12 +74,25 @@ def simulate_burnin_test():
         interface.IN_TestRunning = 1
         interface.IN_DutyCycle = 75  # 75% duty cycle
 
+        # The plugin signals this event when it advances OUT_iCycle, so the
+        # monitor can block instead of polling shared memory
+        event_name = f"BITest_Event_{os.getpid()}"
+        cycle_event = create_cycle_event(event_name)
+        env = dict(os.environ)
+        if cycle_event:
+            env[CYCLE_EVENT_ENV] = event_name
+
         # Start the plugin in a separate process
-        plugin_process = subprocess.Popen([sys.executable, "main.py", shared_mem_name])
+        plugin_process = subprocess.Popen([sys.executable, "main.py", shared_mem_name], env=env)
 
         print("Started plugin process with shared memory:", shared_mem_name)
         print("Plugin process ID:", plugin_process.pid)
 
+        # Keyboard input is read on its own thread
+        stop_event = threading.Event()
+        if msvcrt_available:
+            start_key_reader(stop_event, cycle_event)
+
         # Monitor and display plugin status
         try:
             cycle_count = -1
@@ -52,14 +115,17 @@ def simulate_burnin_test():
                         interface.OUT_bNewError = False
 
                 # Check if user wants to stop
-                if msvcrt_available:
-                    if msvcrt.kbhit():
-                        key = msvcrt.getch()
-                        if key == b'q':
-                            print("Stopping test...")
-                            break
-
-                time.sleep(0.1)
+                if stop_event.is_set():
+                    print("Stopping test...")
+                    break
+
+                # Wait for the next cycle, or the timeout so a stop without
+                # the event still gets noticed
+                if cycle_event:
+                    kernel32, handle = cycle_event
+                    kernel32.WaitForSingleObject(handle, MONITOR_TIMEOUT_MS)
+                else:
+                    time.sleep(0.1)
 
         except KeyboardInterrupt:
             print("Test interrupted by user")
@@ -72,6 +138,9 @@ def simulate_burnin_test():
         print("Plugin process exited with code:", plugin_process.returncode)
 
         # Clean up
+        if cycle_event:
+            kernel32, handle = cycle_event
+            kernel32.CloseHandle(handle)
         h_mapped.close()
 
     except Exception as e:
@@ -0,0 +1,67 @@
+"""Tests for the BurnInPlugin execution loop."""
+
+import sys
+from ctypes import c_int
+
+import pytest
+
+if sys.platform != "win32":
+    pytest.skip("py_burnin_plugin loads kernel32 on import", allow_module_level=True)
+
+from py_burnin_plugin import BurnInPlugin
+
+
+class _FakeInterface:
+    """The PluginInterface members the plugin loop uses, without shared memory."""
+
+    def __init__(self):
+        self.test_running_flag = c_int(1)
+        self.cycle = 0
+        self.duty_cycle = 100
+
+    def set_error(self, message, severity, long_message=None):
+        raise AssertionError(message)
+
+
+class _RecordingPlugin(BurnInPlugin):
+    def __init__(self):
+        super().__init__("test")
+        self.calls = []
+
+    def execute_write_phase(self):
+        self.calls.append("write")
+        return True
+
+    def execute_read_phase(self):
+        self.calls.append("read")
+        return True
+
+    def execute_verify_phase(self):
+        self.calls.append("verify")
+        # Stop after one cycle
+        self._interface.test_running_flag.value = 0
+        return True
+
+
+def _run_one_cycle(plugin):
+    plugin._interface = _FakeInterface()
+    plugin._is_running = True
+    plugin._run_plugin_loop()
+
+
+def test_loop_runs_subclass_phases_in_order():
+    plugin = _RecordingPlugin()
+    _run_one_cycle(plugin)
+    assert plugin.calls == ["write", "read", "verify"]
+
+
+def test_loop_runs_phase_assigned_on_the_instance():
+    plugin = _RecordingPlugin()
+
+    def instance_write():
+        plugin.calls.append("instance write")
+        return True
+
+    plugin.execute_write_phase = instance_write
+    _run_one_cycle(plugin)
+    assert plugin.calls == ["instance write", "read", "verify"]
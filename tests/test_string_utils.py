@@ -0,0 +1,86 @@
+"""Tests for the strn_clean_cpy / clean_and_pad text helpers."""
+
+import importlib.util
+from ctypes import POINTER, addressof, byref, c_char, c_char_p, c_void_p, cast, create_string_buffer
+from pathlib import Path
+
+import pytest
+
+# string_utils only needs ctypes, but importing it through the package runs
+# py_burnin_plugin/__init__.py, which loads kernel32. Load the module from
+# its file so these tests also run off Windows.
+_PATH = Path(__file__).resolve().parents[1] / "src" / "py_burnin_plugin" / "utils" / "string_utils.py"
+_spec = importlib.util.spec_from_file_location("string_utils", _PATH)
+string_utils = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(string_utils)
+
+clean_and_pad = string_utils.clean_and_pad
+strn_clean_cpy = string_utils.strn_clean_cpy
+
+
+def test_clean_and_pad_replaces_percent_backslash_and_control_chars():
+    assert clean_and_pad(b"a%b\\c\x01d", 8) == b"a b c d\0"
+
+
+def test_clean_and_pad_maps_every_control_char_to_space():
+    controls = bytes(range(1, 0x20))
+    assert clean_and_pad(controls, 40) == b" " * len(controls) + b"\0" * (40 - len(controls))
+
+
+def test_clean_and_pad_leaves_printable_ascii_unchanged():
+    printable = bytes(c for c in range(0x20, 0x7F) if c not in (0x25, 0x5C))
+    assert clean_and_pad(printable, 128) == printable.ljust(128, b"\0")
+
+
+def test_clean_and_pad_encodes_str_dropping_non_ascii():
+    assert clean_and_pad("45°C", 8) == b"45C\0\0\0\0\0"
+
+
+def test_clean_and_pad_stops_at_embedded_nul():
+    assert clean_and_pad(b"ab\0cd", 6) == b"ab\0\0\0\0"
+
+
+def test_clean_and_pad_truncates_and_keeps_terminator():
+    assert clean_and_pad("x" * 30, 5) == b"xxxx\0"
+
+
+def test_clean_and_pad_accepts_bytearray():
+    assert clean_and_pad(bytearray(b"q%"), 4) == b"q \0\0"
+
+
+@pytest.mark.parametrize(
+    "make_dest",
+    [
+        lambda buf: buf,
+        lambda buf: addressof(buf),
+        lambda buf: byref(buf),
+        lambda buf: c_void_p(addressof(buf)),
+        lambda buf: cast(buf, c_char_p),
+        lambda buf: cast(buf, POINTER(c_char)),
+    ],
+    ids=["array", "int", "byref", "c_void_p", "c_char_p", "POINTER(c_char)"],
+)
+def test_strn_clean_cpy_writes_through_every_destination_kind(make_dest):
+    buf = create_string_buffer(b"X" * 20, 20)
+    dest = make_dest(buf)
+    pointer_value = dest.value if isinstance(dest, c_void_p) else None
+
+    strn_clean_cpy(dest, b"h%i", 20)
+
+    assert buf.raw == b"h i" + b"\0" * 17
+    if pointer_value is not None:
+        assert dest.value == pointer_value
+
+
+def test_strn_clean_cpy_zeroes_the_previous_contents():
+    buf = create_string_buffer(b"a much longer value", 20)
+    strn_clean_cpy(buf, "ok", 20)
+    assert buf.raw == b"ok" + b"\0" * 18
+
+
+
+@pytest.mark.parametrize("max_len", [0, -1])
+def test_strn_clean_cpy_writes_nothing_without_room(max_len):
+    buf = create_string_buffer(b"keep", 8)
+    strn_clean_cpy(buf, b"overflow", max_len)
+    assert buf.raw == b"keep\0\0\0\0"